@@ -7,6 +7,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 import argparse
 import ftplib
 import logging.config
+import posixpath
 import time
 
 from campbellsciparser import cr
@@ -40,25 +41,36 @@ else:
 
 session.set_debuglevel(debuglevel)
 
+# Remote working directory, tracked to skip redundant CWD commands.
+remote_dir = posixpath.normpath(session.pwd())
+
 
 def cd_tree(current_dir):
+    global remote_dir
     if current_dir != "":
+        target_dir = posixpath.normpath(posixpath.join(remote_dir, current_dir))
+        if target_dir == remote_dir:
+            return
         try:
             session.cwd(current_dir)
         except ftplib.error_perm:
             cd_tree("/".join(current_dir.split("/")[:-1]))
             session.mkd(current_dir)
             session.cwd(current_dir)
+            if not posixpath.isabs(current_dir):
+                # Relative to the parent directory entered above.
+                target_dir = posixpath.normpath(posixpath.join(remote_dir, current_dir))
+        remote_dir = target_dir
 
 
-def transfer_rows(cfg, output_dir, site, location, file, file_info):
+def transfer_rows(cfg, site, location, file, file_info):
     name = file_info.get('name', file)
     file_path = file_info.get('file_path')
     line_num = file_info.get('line_num')
     header_row = file_info.get('header_row')
 
     file_ext = os.path.splitext(os.path.abspath(file_path))[1]  # Get file extension
-    logging.info("Processing file: {file}".format(file=file))
+    logging.info("Processing file: %s", file)
 
     data = cr.read_table_data(
         infile_path=file_path,
@@ -69,36 +81,20 @@ def transfer_rows(cfg, output_dir, site, location, file, file_info):
     num_of_new_rows = 0
     num_of_new_rows += len(data)
 
-    logger_info.info("Found {num} new rows".format(num=num_of_new_rows))
+    logger_info.info("Found %s new rows", num_of_new_rows)
 
     if num_of_new_rows == 0:
-        logger_info.info("No work to be done for table: {table}".format(table=name))
+        logger_info.info("No work to be done for table: %s", name)
     else:
         file_name = name + file_ext
-        output_file_path = os.path.join(
-            os.path.abspath(output_dir), site, location, file_name)
-
-        os.makedirs(os.path.dirname(output_file_path), exist_ok=True)
 
         if file_name not in session.nlst():
-            cr.export_to_csv(
-                data=data,
-                outfile_path=output_file_path,
-                export_header=True
-            )
-            with open(output_file_path, 'rb') as f:  # File to send.
-                session.storbinary('STOR ' + file_name, f)  # Send the file.
+            f = utils.export_to_csv_buffer(data=data, export_header=True)
+            session.storbinary('STOR ' + file_name, f)  # Send the file.
         else:
-            cr.export_to_csv(
-                data=data,
-                outfile_path=output_file_path,
-                export_header=False
-            )
-            with open(output_file_path, 'rb') as f:  # File to send.
-                session.storbinary('APPE ' + file_name, f)  # Send the file.
+            f = utils.export_to_csv_buffer(data=data, export_header=False)
+            session.storbinary('APPE ' + file_name, f)  # Send the file.
 
-
-        os.remove(output_file_path)
         new_line_num = line_num + num_of_new_rows
         cfg['sites'][site]['locations'][location]['files'][file][
             'line_num'] = new_line_num
@@ -116,57 +112,41 @@ def process_sites(cfg, args):
         Arguments passed by the user. Includes site, location and file information.
 
     """
-    try:
-        output_dir = cfg['settings']['data_output_dir']
-    except KeyError:
-        output_dir = os.path.expanduser("~")
-        msg = "No output directory set! "
-        msg += "Files will be output to the user's default directory at {output_dir}"
-        msg = msg.format(output_dir=output_dir)
-        logger_info.info(msg)
-
-    logger_debug.debug("Output directory: {dir}".format(dir=output_dir))
-
     logger_debug.debug("Getting configured sites.")
 
     sites = cfg['sites']
 
-    configured_sites_msg = ', '.join("{site}".format(site=site) for site in sites)
-    logger_debug.debug("Configured sites: {sites}.".format(sites=configured_sites_msg))
+    if logger_debug.isEnabledFor(logging.DEBUG):
+        logger_debug.debug("Configured sites: %s.", ', '.join(map(str, sites)))
 
-    root_dir = session.pwd()
+    root_dir = remote_dir
 
     try:
         if args.site:
             # Process specific site
-            logger_info.info("Processing site: {site}".format(site=args.site))
+            logger_info.info("Processing site: %s", args.site)
             site_info = sites[args.site]
             logger_debug.debug("Getting configured locations.")
             locations = site_info['locations']
-            configured_locations_msg = ', '.join("{location}".format(
-                location=location) for location in locations)
-            logger_debug.debug("Configured locations: {locations}.".format(
-                locations=configured_locations_msg))
+            if logger_debug.isEnabledFor(logging.DEBUG):
+                logger_debug.debug("Configured locations: %s.", ', '.join(map(str, locations)))
             cd_tree(args.site)
-            site_dir = session.pwd()
+            site_dir = remote_dir
             if args.location:
                 # Process specific location
-                logger_info.info("Processing location: {location}".format(location=args.location))
+                logger_info.info("Processing location: %s", args.location)
                 location_info = locations[args.location]
                 files = location_info['files']
-                configured_files_msg = ', '.join("{file}".format(
-                    file=file) for file in files)
-                logger_debug.debug("Configured files: {files}.".format(
-                    files=configured_files_msg))
+                if logger_debug.isEnabledFor(logging.DEBUG):
+                    logger_debug.debug("Configured files: %s.", ', '.join(map(str, files)))
                 cd_tree(args.location)
-                location_dir = session.pwd()
+                location_dir = remote_dir
                 if args.file:
                     # Process specific file
                     file_info = files[args.file]
                     cd_tree(args.file)
                     transfer_rows(
                         cfg,
-                        output_dir,
                         args.site,
                         args.location,
                         args.file,
@@ -174,11 +154,9 @@ def process_sites(cfg, args):
                 else:
                     # Process all files
                     for file, file_info in files.items():
-                        cd_tree(location_dir)
-                        cd_tree(file)
+                        cd_tree(posixpath.join(location_dir, file))
                         transfer_rows(
                             cfg,
-                            output_dir,
                             args.site,
                             args.location,
                             file,
@@ -187,15 +165,12 @@ def process_sites(cfg, args):
                 # Process all locations
                 for location, location_info in locations.items():
                     files = location_info['files']
-                    cd_tree(site_dir)
-                    cd_tree(location)
-                    location_dir = session.pwd()
+                    cd_tree(posixpath.join(site_dir, location))
+                    location_dir = remote_dir
                     for file, file_info in files.items():
-                        cd_tree(location_dir)
-                        cd_tree(file)
+                        cd_tree(posixpath.join(location_dir, file))
                         transfer_rows(
                             cfg,
-                            output_dir,
                             args.site,
                             location,
                             file,
@@ -204,20 +179,16 @@ def process_sites(cfg, args):
             # Process all sites
             for site, site_info in sites.items():
                 locations = site_info['locations']
-                cd_tree(root_dir)
-                cd_tree(site)
-                site_dir = session.pwd()
+                cd_tree(posixpath.join(root_dir, site))
+                site_dir = remote_dir
                 for location, location_info in locations.items():
                     files = location_info['files']
-                    cd_tree(site_dir)
-                    cd_tree(location)
-                    location_dir = session.pwd()
+                    cd_tree(posixpath.join(site_dir, location))
+                    location_dir = remote_dir
                     for file, file_info in files.items():
-                        cd_tree(location_dir)
-                        cd_tree(file)
+                        cd_tree(posixpath.join(location_dir, file))
                         transfer_rows(
                             cfg,
-                            output_dir,
                             site,
                             location,
                             file,
@@ -247,10 +218,9 @@ def setup_parser():
 
     args = parser.parse_args()
     logger_debug.debug("Arguments passed by user")
-    args_msg = ', '.join("{arg}: {value}".format(
-        arg=arg, value=value) for (arg, value) in vars(args).items())
-
-    logger_debug.debug(args_msg)
+    if logger_debug.isEnabledFor(logging.DEBUG):
+        logger_debug.debug(', '.join("{arg}: {value}".format(
+            arg=arg, value=value) for (arg, value) in vars(args).items()))
 
     if args.file:
         if not args.location and not args.site:
@@ -274,7 +244,7 @@ def setup_parser():
     stop = time.time()
     elapsed = (stop - start)
 
-    logger_info.info("Finished job in {elapsed} seconds".format(elapsed=elapsed))
+    logger_info.info("Finished job in %s seconds", elapsed)
 
 if __name__ == '__main__':
     setup_parser()
@@ -8,19 +8,37 @@ import sys
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import argparse
+import concurrent.futures
+import csv
+import itertools
 import logging.config
 import time
 
+from collections import namedtuple
+from datetime import datetime
+
+import pytz
+
 from campbellsciparser import cr
 
+try:
+    import pandas as pd
+except ImportError:  # Optional, enables vectorized time parsing.
+    pd = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # Optional, enables Parquet export.
+    pa = None
+    pq = None
+
 from services import utils
 
 BASE_DIR = os.path.dirname(os.path.dirname(__file__))
 APP_CONFIG_PATH = os.path.join(BASE_DIR, 'cfg/loggerfilesformatter.yaml')
 LOGGING_CONFIG_PATH = os.path.join(BASE_DIR, 'cfg/logging.yaml')
 
-logging_conf = utils.load_config(LOGGING_CONFIG_PATH)
-logging.config.dictConfig(logging_conf)
 logger_info = logging.getLogger('loggerfilesformatter_info')
 logger_debug = logging.getLogger('loggerfilesformatter_debug')
 
@@ -33,26 +51,204 @@ class UnsupportedValueConversionType(ValueError):
     pass
 
 
-def update_column_values_generator(data_old, data_new):
-    """Iterates one old and one new data set, replacing the modified columns.
+class UnsupportedExportFormat(ValueError):
+    pass
+
+
+# Time strings pandas parses as the current time instead of rejecting them.
+PANDAS_TIME_LITERALS = frozenset(['now', 'today'])
+
+ArrayConfig = namedtuple('ArrayConfig', [
+    'name',
+    'column_names',
+    'export_columns',
+    'include_time_zone',
+    'time_columns',
+    'time_parsed_column_name',
+    'to_utc',
+    'convert_data_column_values',
+    'export_format'
+])
+
+
+def get_column_values(data, column_name):
+    """Returns the values of a single column.
 
     Parameters
     ----------
-    data_old : DataSet
+    data : DataSet
+        Data set to read from.
+    column_name : str or int
+        Column name (or index) to read.
+
+    Returns
+    -------
+    list
+        Column values, one per row.
+
+    """
+    return [row[column_name] for row in data]
+
+
+def set_columns_values(data, columns):
+    """Overwrites the values of one or more columns in place, in a single pass over the rows.
+
+    Parameters
+    ----------
+    data : DataSet
         Data set to update.
-    data_new : DataSet
-        Data set to read updates from.
+    columns : dict of list
+        New column values, one per row, by column name (or index).
 
-    Yields
-    ------
+    """
+    column_names = list(columns)
+    for row, values in zip(data, zip(*columns.values())):
+        row.update(zip(column_names, values))
+
+
+def _parse_time_values_vectorized(data, value_time_columns, time_zone,
+                                  time_format_args_library, to_utc):
+    """Parses time values of all rows at once using pandas.
+
+    Mirrors cr.parse_time's handling of time values (time columns are read in row order,
+    matched against the time format library and 'Hour/Minute' values are zero padded),
+    but runs strptime as a single vectorized call.
+
+    Parameters
+    ----------
+    data : DataSet
+        Data set to read time values from.
+    value_time_columns : list of str or int
+        Column(s) (names or indices) to use for time conversion.
+    time_zone : str
+        String representation of a valid pytz time zone.
+    time_format_args_library : list of str
+        List of the maximum expected string format columns sequence to match against
+        when parsing time values.
+    to_utc : bool
+        Convert time to UTC.
+
+    Returns
+    -------
+    list of datetime or None
+        Parsed time values, one per row. None if the values can't be handled here, in
+        which case cr.parse_time should be used instead.
+
+    """
+    if pd is None or not data or not value_time_columns or not time_format_args_library:
+        return None
+
+    try:
+        pytz_time_zone = pytz.timezone(time_zone)
+    except pytz.UnknownTimeZoneError:
+        return None
+
+    time_column_names = [name for name in data[0] if name in value_time_columns]
+    time_format_args = time_format_args_library[:len(time_column_names)]
+    time_format = ','.join(time_format_args)
+
+    if '%z' in time_format or '%Z' in time_format:
+        return None
+
+    hour_minute_indices = [i for i, arg in enumerate(time_format_args) if arg == '%H%M']
+
+    time_strings = []
+    try:
+        for row in data:
+            time_values = [row[name] for name in time_column_names]
+            for i in hour_minute_indices:
+                if not 0 < len(time_values[i]) <= 4:
+                    return None
+                time_values[i] = time_values[i].zfill(4)
+            time_string = ','.join(time_values[:len(time_format_args)])
+            if time_string.strip().lower() in PANDAS_TIME_LITERALS:
+                # Parsed by pandas as the current time, rejected by strptime.
+                return None
+            time_strings.append(time_string)
+    except (KeyError, TypeError, AttributeError):
+        return None
+
+    try:
+        parsed_times = pd.to_datetime(time_strings, format=time_format)
+    except ValueError:
+        return None
+
+    if parsed_times.isna().any():
+        # Empty and 'NaN'-like strings are parsed as NaT, rejected by strptime.
+        return None
+
+    parsed_times = parsed_times.to_pydatetime()
+
+    localized_times = [pytz_time_zone.localize(dt) for dt in parsed_times]
+
+    if to_utc:
+        return [dt.astimezone(pytz.utc) for dt in localized_times]
+
+    return localized_times
+
+
+def parse_data_time_columns(data, time_zone, time_format_args_library, time_columns,
+                            time_parsed_column=None, to_utc=False):
+    """Parses time columns into a single datetime column, like cr.parse_time.
+
+    The time values are parsed at once (see _parse_time_values_vectorized) if possible,
+    else cr.parse_time is used. Rows are rebuilt like cr.parse_time does: the first time
+    column is replaced by the parsed time column and the other time columns are removed.
+
+    Parameters
+    ----------
+    data : DataSet
+        Data set to convert.
+    time_zone : str
+        String representation of a valid pytz time zone.
+    time_format_args_library : list of str
+        List of the maximum expected string format columns sequence to match against
+        when parsing time values.
+    time_columns : list of str or int
+        Column(s) (names or indices) to use for time conversion.
+    time_parsed_column : str, optional
+        Parsed time column name. Defaults to the first time column's name.
+    to_utc : bool, optional
+        Convert time to UTC.
+
+    Returns
+    -------
     DataSet
-        Updated data set.
+        Time converted data set.
 
     """
-    for row_old, row_new in zip(data_old, data_new):
-        for name, value_new in row_new.items():
-            row_old[name] = value_new
-        yield row_old
+    parsed_times = None
+    if data and time_columns and time_columns[0] in data[0]:
+        parsed_times = _parse_time_values_vectorized(
+            data=data,
+            value_time_columns=time_columns,
+            time_zone=time_zone,
+            time_format_args_library=time_format_args_library,
+            to_utc=to_utc)
+
+    if parsed_times is None:
+        return cr.parse_time(
+            data=data,
+            time_zone=time_zone,
+            time_format_args_library=time_format_args_library,
+            time_parsed_column=time_parsed_column,
+            time_columns=time_columns,
+            to_utc=to_utc)
+
+    old_name = time_columns[0]
+    new_name = time_parsed_column or old_name
+    columns_to_remove = [name for name in time_columns if name != new_name]
+
+    data_converted = cr.DataSet([])
+    for row, parsed_time in zip(data, parsed_times):
+        row_converted = cr.Row(
+            (new_name if name == old_name else name, value) for name, value in row.items())
+        row_converted[new_name] = parsed_time
+        for name in columns_to_remove:
+            row_converted.pop(name, None)
+        data_converted.append(row_converted)
+
+    return data_converted
 
 
 def convert_data_time_values(data, column_name, value_time_columns, time_zone,
@@ -79,11 +275,22 @@ def convert_data_time_values(data, column_name, value_time_columns, time_zone,
 
     Returns
     -------
-    DataSet
-        Data time converted data set.
+    list of datetime
+        Converted column values, one per row.
 
     """
-    return cr.parse_time(
+    if data and column_name in data[0]:
+        converted_values = _parse_time_values_vectorized(
+            data=data,
+            value_time_columns=value_time_columns,
+            time_zone=time_zone,
+            time_format_args_library=time_format_args_library,
+            to_utc=to_utc)
+
+        if converted_values is not None:
+            return converted_values
+
+    data_converted = cr.parse_time(
         data=data,
         time_zone=time_zone,
         time_format_args_library=time_format_args_library,
@@ -92,87 +299,235 @@ def convert_data_time_values(data, column_name, value_time_columns, time_zone,
         replace_time_column=column_name,
         to_utc=to_utc)
 
+    return get_column_values(data_converted, column_name)
+
 
-def make_data_set_backup(data):
-    """Returns a copy of the given data set.
+def export_columns_generator(data, columns_to_export):
+    """Iterates a data set, keeping only the columns to export.
+
+    Rows are produced lazily so the filtered data set is never stored in full; it can be
+    passed straight to export_data_set.
 
     Parameters
     ----------
     data : DataSet
-        Data set to backup.
+        Data set to extract columns from.
+    columns_to_export : list or frozenset of str or int
+        Columns to extract from source data set.
+
+    Yields
+    ------
+    Row
+        Row holding only the columns to export.
+
+    """
+    columns_to_export = frozenset(columns_to_export)
+    column_names = None
+    export_all = False
+
+    for row in data:
+        if column_names is None:
+            # Rows share the same columns, resolve the export columns (in row order) once.
+            column_names = [name for name in row if name in columns_to_export]
+            export_all = len(column_names) == len(row)
+        if export_all and len(row) == len(column_names):
+            yield cr.Row(row)
+        else:
+            yield cr.Row([(name, row[name]) for name in column_names if name in row])
+
+
+def check_export_format(export_format):
+    """Checks that data can be exported in the given file format.
+
+    Parameters
+    ----------
+    export_format : str
+        Either 'csv' or 'parquet'.
+
+    Raises
+    ------
+    UnsupportedExportFormat: If an unsupported export format is given, or if the format is
+        'parquet' and pyarrow is not installed.
+
+    """
+    if export_format not in ('csv', 'parquet'):
+        msg = "Unsupported export format {export_format}, valid formats are csv and parquet."
+        raise UnsupportedExportFormat(msg.format(export_format=export_format))
+
+    if export_format == 'parquet' and pa is None:
+        raise UnsupportedExportFormat("Parquet export requires pyarrow to be installed.")
+
+
+def _read_parquet_parts_schema(outdir_path):
+    """Returns the schema of the part files already written to a directory.
+
+    Parameters
+    ----------
+    outdir_path : str
+        Output directory's absolute path.
 
     Returns
     -------
-    DataSet
-        Copy of given data set.
+    pyarrow.Schema
+        Schema of the first part file, None if no part file exists yet.
 
     """
-    return cr.DataSet(
-        [cr.Row([(name, value) for name, value in row.items()])
-         for row in data]
-    )
+    if not os.path.isdir(outdir_path):
+        return None
+
+    for file_name in sorted(os.listdir(outdir_path)):
+        if file_name.endswith('.parquet'):
+            return pq.read_schema(os.path.join(outdir_path, file_name))
+
+    return None
 
 
-def make_export_data_set(data, columns_to_export):
-    """Create an 'export' data set, i.e. a data set filtered by columns to export.
+def _to_parquet_array(name, values, value_type=None):
+    """Converts a column of exported values to a pyarrow array.
+
+    Without a given type, columns holding only numeric strings (including logger 'NAN'
+    values) are stored as float64 and other string columns as strings, so part files of
+    different runs share the same schema. Other columns (e.g. parsed time values) are left
+    to pyarrow's type inference. With a given type (taken from an existing part file),
+    values are converted to it; numeric values that can't be converted are stored as null.
 
     Parameters
     ----------
-    data : DataSet
-        Data set to extract columns from.
-
-    columns_to_export : list of str or int
-        Columns to extract from source data set.
+    name : str
+        Column name, used for logging.
+    values : list
+        Column values.
+    value_type : pyarrow.DataType, optional
+        Type to store the values as.
 
     Returns
     -------
-    DataSet
-        Data set ready to export.
+    pyarrow.Array
+        Column values.
 
     """
-    data_to_export = cr.DataSet()
-    for row in data:
-        data_to_export.append(cr.Row(
-            [(name, value) for name, value in row.items() if name in columns_to_export]
-        ))
+    all_strings = all(isinstance(value, str) for value in values)
+
+    if value_type is None:
+        if not all_strings:
+            return pa.array(values)
+        try:
+            return pa.array([float(value) for value in values], type=pa.float64())
+        except ValueError:
+            return pa.array(values, type=pa.string())
 
-    return data_to_export
+    if all_strings and (pa.types.is_floating(value_type) or pa.types.is_integer(value_type)):
+        value_converter = float if pa.types.is_floating(value_type) else int
+        converted_values = []
+        for value in values:
+            try:
+                converted_values.append(value_converter(value))
+            except ValueError:
+                converted_values.append(None)
 
+        num_of_invalid_values = converted_values.count(None)
+        if num_of_invalid_values:
+            logger_info.warning(
+                "%s values of column %s can't be stored as %s, stored as null instead.",
+                num_of_invalid_values, name, value_type)
 
-def restore_data_after_data_time_conversion(data, data_backup, converted_column_name):
-    """Convenience for restoring time values that was removed for data time conversion.
+        return pa.array(converted_values, type=value_type)
+
+    if pa.types.is_string(value_type):
+        return pa.array([str(value) for value in values], type=value_type)
+
+    return pa.array(values, type=value_type)
+
+
+def export_to_parquet(data, outdir_path):
+    """Writes a data set to a new Parquet file in the given directory.
+
+    Parquet files can't be appended to, so each call writes a new file (named by the
+    current UTC time) and the directory as a whole holds the exported data. Columns take
+    their types from the part files already in the directory, so the directory can be read
+    as one data set; the first part file stores numeric columns as float64 and time values
+    as timestamps carrying their time zone.
 
     Parameters
     ----------
     data : DataSet
-        Data time value converted data set.
-    data_backup : DataSet
-        Source data set.
-    converted_column_name : str or int
-        Column name (or index) that was converted.
+        Data set to export.
+    outdir_path : str
+        Output directory's absolute path.
 
     Returns
     -------
-    DataSet
-        Data time converted data set with its original time values restored.
+    str
+        Written file's absolute path, None if the data set is empty.
+
+    Raises
+    ------
+    UnsupportedExportFormat: If pyarrow is not installed.
 
     """
-    data_converted = []
+    if pa is None:
+        raise UnsupportedExportFormat("Parquet export requires pyarrow to be installed.")
 
+    columns = {}
     for row in data:
-        converted_values = cr.Row()
-        for converted_name, converted_value in row.items():
-            if converted_name == converted_column_name:
-                converted_values[converted_column_name] = converted_value
+        for name, value in row.items():
+            columns.setdefault(str(name), []).append(value)
 
-                data_converted.append(converted_values)
+    if not columns:
+        return None
 
-    data_merged = [row for row in update_column_values_generator(
-        data_old=data_backup,
-        data_new=data_converted
-    )]
+    schema = _read_parquet_parts_schema(outdir_path)
+    value_types = {}
+    if schema is not None:
+        value_types = {field.name: field.type for field in schema}
 
-    return data_merged
+    table = pa.table({
+        name: _to_parquet_array(name, values, value_types.get(name))
+        for name, values in columns.items()
+    })
+
+    os.makedirs(outdir_path, exist_ok=True)
+    file_name = datetime.now(pytz.utc).strftime('%Y%m%d%H%M%S%f') + '.parquet'
+    outfile_path = os.path.join(outdir_path, file_name)
+    pq.write_table(table, outfile_path)
+
+    return outfile_path
+
+
+def export_data_set(data, outfile_path, export_format='csv', include_time_zone=False):
+    """Exports a data set in the given file format.
+
+    Parameters
+    ----------
+    data : DataSet
+        Data set to export.
+    outfile_path : str
+        Output file's absolute path. For Parquet, the path without its file extension
+        is used as output directory.
+    export_format : str, optional
+        Either 'csv' (default) or 'parquet'.
+    include_time_zone : bool, optional
+        Include time zone in string converted datetime values. Ignored for Parquet, where
+        time values always keep their time zone.
+
+    Raises
+    ------
+    UnsupportedExportFormat: If an unsupported export format is given.
+
+    """
+    check_export_format(export_format)
+
+    if export_format == 'csv':
+        cr.export_to_csv(
+            data=data,
+            outfile_path=outfile_path,
+            export_header=True,
+            include_time_zone=include_time_zone
+        )
+    else:
+        if include_time_zone:
+            logger_debug.debug("Include time zone is ignored for Parquet export.")
+        export_to_parquet(data=data, outdir_path=os.path.splitext(outfile_path)[0])
 
 
 def convert_data_column_values(data, values_to_convert, time_zone, time_format_args_library, to_utc):
@@ -197,19 +552,17 @@ def convert_data_column_values(data, values_to_convert, time_zone, time_format_a
     Returns
     -------
     DataSet
-        Column values converted data set.
+        Column values converted data set (the given data set, updated in place).
 
     """
-    data_converted = cr.DataSet()
-
-    data_backup = make_data_set_backup(data)
+    converted_columns = {}
 
     for column_name, convert_column_info in values_to_convert.items():
         value_type = convert_column_info.get('value_type')
         value_time_columns = convert_column_info.get('value_time_columns')
 
         if value_type == 'time':
-            array_id_data_converted_values_all = convert_data_time_values(
+            converted_columns[column_name] = convert_data_time_values(
                 data=data,
                 column_name=column_name,
                 value_time_columns=value_time_columns,
@@ -221,17 +574,135 @@ def convert_data_column_values(data, values_to_convert, time_zone, time_format_a
             msg = "Only time conversion is supported in this version."
             raise UnsupportedValueConversionType(msg)
 
-        data_converted = restore_data_after_data_time_conversion(
-            data=array_id_data_converted_values_all,
-            data_backup=data_backup,
-            converted_column_name=column_name
-        )
+    set_columns_values(data=data, columns=converted_columns)
 
-    return data_converted
+    return data
+
+
+def prepare_array_ids_info(array_ids_info):
+    """Unpacks the array ids lookup table in a single pass.
+
+    Parameters
+    ----------
+    array_ids_info : dict of dict
+        File processing and exporting information, by array id.
+
+    Returns
+    -------
+    dict
+        Array names, by array id.
+    list of ArrayConfig
+        Array processing information, one per array id. Export columns are stored as a
+        frozenset and time columns as a tuple.
+
+    Raises
+    ------
+    UnsupportedExportFormat: If an array's export format can't be used, checked before
+        any data is read or exported.
+
+    """
+    array_id_names = {}
+    array_ids_config = []
+
+    for array_id, array_id_info in array_ids_info.items():
+        array_name = array_id_info.get('name', array_id)
+        array_id_names[array_id] = array_name
+        export_columns = array_id_info.get('export_columns')
+        time_columns = array_id_info.get('time_columns')
+        export_format = array_id_info.get('export_format', 'csv')
+        check_export_format(export_format)
+        array_ids_config.append(ArrayConfig(
+            name=array_name,
+            column_names=array_id_info.get('column_names'),
+            export_columns=frozenset(export_columns) if export_columns is not None else None,
+            include_time_zone=array_id_info.get('include_time_zone', False),
+            time_columns=tuple(time_columns) if time_columns is not None else None,
+            time_parsed_column_name=array_id_info.get('time_parsed_column_name', 'Timestamp'),
+            to_utc=array_id_info.get('to_utc', False),
+            convert_data_column_values=array_id_info.get('convert_data_column_values'),
+            export_format=export_format
+        ))
+
+    return array_id_names, array_ids_config
+
+
+def read_array_ids_data(infile_path, first_line_num=0, byte_offset=None, fix_floats=True,
+                        array_id_names=None):
+    """Reads new mixed array data, filtered by array id (each rows' first element).
+
+    Rows are parsed like cr.read_array_ids_data, but reading starts at a byte offset
+    instead of re-reading the file from its first line. If no byte offset is known yet,
+    the first lines are skipped once to find it. A last line that isn't terminated yet is
+    left for the next run.
+
+    Parameters
+    ----------
+    infile_path : str
+        Input file's absolute path.
+    first_line_num : int, optional
+        First line number to read, used when no byte offset is given. NOTE: Zero-based
+        numbering.
+    byte_offset : int, optional
+        Byte offset of the first line to read.
+    fix_floats : bool
+        Correct leading zeros for floating points values since many older CR-type
+        dataloggers strips leading zeros.
+    array_id_names : dict
+        Lookup table for array id name translation.
+
+    Returns
+    -------
+    dict of DataSet
+        All data found from the given line onwards, filtered by array id.
+    int
+        Number of lines read.
+    int
+        Byte offset to continue reading from.
+
+    """
+    if not array_id_names:
+        array_id_names = {}
+
+    with open(infile_path, 'rb') as f:
+        if byte_offset is None:
+            for _ in range(first_line_num):
+                byte_offset = f.tell()
+                if not f.readline().endswith(b'\n'):
+                    # Unterminated, start reading at this line once it's complete.
+                    f.seek(byte_offset)
+                    break
+            byte_offset = f.tell()
+        else:
+            f.seek(byte_offset)
+
+        lines = []
+        for line in f:
+            if not line.endswith(b'\n'):
+                break
+            lines.append(line.decode('utf-8'))
+            byte_offset += len(line)
+
+    replacements = {'.': '0.', '-.': '-0.'}  # Patterns to look for
+    data = {}
+
+    for row in csv.reader(lines):
+        if not row or row[0] not in array_id_names:
+            continue
+        if fix_floats:
+            for i, value in enumerate(row):
+                for source, replacement in replacements.items():
+                    if value.startswith(source):
+                        row[i] = value.replace(source, replacement)
+
+        array_name = array_id_names[row[0]] or row[0]
+        data.setdefault(array_name, cr.DataSet()).append(
+            cr.Row(enumerate(row)))
+
+    return data, len(lines), byte_offset
 
 
 def process_array_ids(site, location, datalogger, data, time_zone, time_format_args_library,
-                      output_dir, array_ids_info, file_ext):
+                      output_dir, array_ids_config, file_ext):
     """Splits apart mixed array location files into subfiles based on each rows' array id.
 
     Parameters
@@ -253,8 +724,8 @@ def process_array_ids(site, location, datalogger, data, time_zone, time_format_a
         when parsing time values.
     output_dir : str
         Output directory.
-    array_ids_info : dict of dict
-        File processing and exporting information.
+    array_ids_config : list of ArrayConfig
+        Array processing information, as returned by prepare_array_ids_info.
     file_ext : str
         Output file extension.
 
@@ -264,60 +735,45 @@ def process_array_ids(site, location, datalogger, data, time_zone, time_format_a
 
     """
 
-    for array_id, array_id_info in array_ids_info.items():
-        array_name = array_id_info.get('name', array_id)
+    datalogger_dir = os.path.join(os.path.abspath(output_dir), site, location, datalogger)
+    logger_debug.debug("Datalogger output directory: %s", datalogger_dir)
 
-        logger_info.info("Processing array: {array_name}".format(array_name=array_name))
+    for array_config in array_ids_config:
+        array_name = array_config.name
+        logger_info.info("Processing array: %s", array_name)
         array_id_data = data.get(array_name)
-        logger_info.info("{num} new rows".format(num=len(array_id_data)))
 
         if not array_id_data:
-            logger_info.info("No work to be done for array: {array_name}".format(array_name=array_name))
+            # Skip arrays without new rows before unpacking the rest of their config.
+            logger_info.info("No work to be done for array: %s", array_name)
             continue
 
-        column_names = array_id_info.get('column_names')
-        logger_debug.debug("Column names : {column_names}".format(column_names=column_names))
-
-        export_columns = array_id_info.get('export_columns')
-        logger_debug.debug(
-            "Export columns: {export_columns}".format(export_columns=export_columns))
+        logger_info.info("%s new rows", len(array_id_data))
 
-        include_time_zone = array_id_info.get('include_time_zone', False)
-        logger_debug.debug("Include time zone: {include_time_zone}".format(
-            include_time_zone=include_time_zone))
-
-        time_columns = array_id_info.get('time_columns')
-        logger_debug.debug("Time columns: {time_columns}".format(time_columns=time_columns))
+        (array_name, column_names, export_columns, include_time_zone, time_columns,
+         time_parsed_column_name, to_utc, column_values_to_convert,
+         export_format) = array_config
 
-        time_parsed_column_name = array_id_info.get('time_parsed_column_name', 'Timestamp')
-        logger_debug.debug("Time parsed column {time_parsed_column_name}".format(
-            time_parsed_column_name=time_parsed_column_name))
-
-        to_utc = array_id_info.get('to_utc', False)
-        logger_debug.debug("To UTC {to_utc}".format(to_utc=to_utc))
-
-        column_values_to_convert = array_id_info.get('convert_data_column_values')
-        logger_debug.debug("Convert column_values: {column_values_to_convert}".format(
-            column_values_to_convert=column_values_to_convert))
+        logger_debug.debug("Column names : %s", column_names)
+        logger_debug.debug("Export columns: %s", export_columns)
+        logger_debug.debug("Include time zone: %s", include_time_zone)
+        logger_debug.debug("Time columns: %s", time_columns)
+        logger_debug.debug("Time parsed column %s", time_parsed_column_name)
+        logger_debug.debug("To UTC %s", to_utc)
+        logger_debug.debug("Convert column_values: %s", column_values_to_convert)
+        logger_debug.debug("Export format: %s", export_format)
 
         array_id_file = array_name + file_ext
-        logger_debug.debug("Array id file: {array_id_file}".format(
-            array_id_file=array_id_file))
+        logger_debug.debug("Array id file: %s", array_id_file)
 
-        array_id_file_path = os.path.join(
-            os.path.abspath(output_dir), site, location, datalogger, array_id_file)
-        logger_debug.debug("Array id file path: {array_id_file_path}".format(
-            array_id_file_path=array_id_file_path))
+        array_id_file_path = os.path.join(datalogger_dir, array_id_file)
+        logger_debug.debug("Array id file path: %s", array_id_file_path)
 
         array_id_mismatches_file = array_name + ' Mismatches' + file_ext
-        logger_debug.debug("Array id mismatched file: {array_id_mismatches_file}".format(
-            array_id_mismatches_file=array_id_mismatches_file))
+        logger_debug.debug("Array id mismatched file: %s", array_id_mismatches_file)
 
-        array_id_mismatches_file_path = os.path.join(
-            os.path.abspath(output_dir), site, location, datalogger, array_id_mismatches_file)
-        logger_debug.debug(
-            "Array id mismatched file path: {array_id_mismatches_file_path}".format(
-                array_id_mismatches_file_path=array_id_mismatches_file_path))
+        array_id_mismatches_file_path = os.path.join(datalogger_dir, array_id_mismatches_file)
+        logger_debug.debug("Array id mismatched file path: %s", array_id_mismatches_file_path)
 
         logger_info.info("Assigning column names")
 
@@ -327,10 +783,9 @@ def process_array_ids(site, location, datalogger, data, time_zone, time_format_a
             match_row_lengths=True,
             get_mismatched_row_lengths=True)
 
-        logger_info.info("Number of matched row lengths: {matched}".format(
-            matched=len(array_id_data_with_column_names)))
-        logger_info.info("Number of mismatched row lengths: {mismatched}".format(
-            mismatched=len(mismatches)))
+        logger_info.info(
+            "Number of matched row lengths: %s", len(array_id_data_with_column_names))
+        logger_info.info("Number of mismatched row lengths: %s", len(mismatches))
 
         if column_values_to_convert:
             array_id_data_with_column_names = convert_data_column_values(
@@ -341,7 +796,7 @@ def process_array_ids(site, location, datalogger, data, time_zone, time_format_a
                 to_utc=to_utc
             )
 
-        array_id_data_time_converted = cr.parse_time(
+        array_id_data_time_converted = parse_data_time_columns(
             data=array_id_data_with_column_names,
             time_zone=time_zone,
             time_format_args_library=time_format_args_library,
@@ -349,13 +804,13 @@ def process_array_ids(site, location, datalogger, data, time_zone, time_format_a
             time_columns=time_columns,
             to_utc=to_utc)
 
-        data_to_export = make_export_data_set(
+        data_to_export = export_columns_generator(
             data=array_id_data_time_converted, columns_to_export=export_columns)
 
-        cr.export_to_csv(
+        export_data_set(
             data=data_to_export,
             outfile_path=array_id_file_path,
-            export_header=True,
+            export_format=export_format,
             include_time_zone=include_time_zone
         )
 
@@ -380,7 +835,7 @@ def process_mixed_array(cfg, output_dir, site, location, datalogger, datalogger_
         Datalogger id.
     datalogger_info : dict
         Datalogger information including the datalogger's array ids lookup table, source file
-        path and last read line number.
+        path, last read line number and the byte offset (and line number) it was read up to.
     track: If true, update configuration file with the last read line number.
 
     Returns
@@ -389,30 +844,40 @@ def process_mixed_array(cfg, output_dir, site, location, datalogger, datalogger_
 
     """
     array_ids_info = datalogger_info.get('array_ids', {})
-    logger_debug.debug(
-        "Array ids info: {array_ids_info}".format(array_ids_info=array_ids_info))
+    logger_debug.debug("Array ids info: %s", array_ids_info)
 
     file_path = datalogger_info.get('file_path')
-    logger_debug.debug("File path: {file_path}".format(file_path=file_path))
+    logger_debug.debug("File path: %s", file_path)
 
     line_num = datalogger_info.get('line_num', 0)
-    logger_debug.debug("Line num: {line_num}".format(line_num=line_num))
+    logger_debug.debug("Line num: %s", line_num)
+
+    byte_offset = datalogger_info.get('byte_offset')
+    logger_debug.debug("Byte offset: %s", byte_offset)
+
+    byte_offset_line_num = datalogger_info.get('byte_offset_line_num')
+    logger_debug.debug("Byte offset line num: %s", byte_offset_line_num)
+
+    if byte_offset is not None and byte_offset_line_num != line_num:
+        # Line number changed since the byte offset was stored (e.g. lowered to export
+        # rows again), the line number takes precedence.
+        msg = "Line num %s doesn't match the byte offset's line num %s, "
+        msg += "skipping lines to find the new byte offset."
+        logger_info.warning(msg, line_num, byte_offset_line_num)
+        byte_offset = None
 
     time_zone = datalogger_info.get('time_zone')
-    logger_debug.debug("Time zone: {time_zone}".format(time_zone=time_zone))
+    logger_debug.debug("Time zone: %s", time_zone)
 
     time_format_args_library = datalogger_info.get('time_format_args_library')
-    logger_debug.debug("Time format args library: {time_format_args_library}".format(
-        time_format_args_library=time_format_args_library))
+    logger_debug.debug("Time format args library: %s", time_format_args_library)
 
-    array_id_names = {
-        array_id: array_id_info.get('name', array_id)
-        for array_id, array_id_info in array_ids_info.items()
-    }
+    array_id_names, array_ids_config = prepare_array_ids_info(array_ids_info)
 
-    data = cr.read_array_ids_data(
+    data, num_of_new_lines, new_byte_offset = read_array_ids_data(
         infile_path=file_path,
         first_line_num=line_num,
+        byte_offset=byte_offset,
         fix_floats=True,
         array_id_names=array_id_names
     )
@@ -422,34 +887,35 @@ def process_mixed_array(cfg, output_dir, site, location, datalogger, datalogger_
     for array_id, array_id_data in data.items():
         num_of_new_rows += len(array_id_data)
 
-    logger_info.info("Found {num} new rows".format(num=num_of_new_rows))
+    logger_info.info("Found %s new rows", num_of_new_rows)
     if num_of_new_rows == 0:
-        logger_info.info("No work to be done for location: {location}".format(location=location))
-        return cfg
-
-    file_ext = os.path.splitext(os.path.abspath(file_path))[1]  # Get file extension
-    logger_debug.debug("File ext: {file_ext}".format(file_ext=file_ext))
+        logger_info.info("No work to be done for location: %s", location)
+    else:
+        file_ext = os.path.splitext(os.path.abspath(file_path))[1]  # Get file extension
+        logger_debug.debug("File ext: %s", file_ext)
 
-    process_array_ids(
-        site=site,
-        location=location,
-        datalogger=datalogger,
-        data=data,
-        time_zone=time_zone,
-        time_format_args_library=time_format_args_library,
-        output_dir=output_dir,
-        array_ids_info=array_ids_info,
-        file_ext=file_ext
-    )
+        process_array_ids(
+            site=site,
+            location=location,
+            datalogger=datalogger,
+            data=data,
+            time_zone=time_zone,
+            time_format_args_library=time_format_args_library,
+            output_dir=output_dir,
+            array_ids_config=array_ids_config,
+            file_ext=file_ext
+        )
 
     if track:
-        if num_of_new_rows > 0:
-            new_line_num = line_num + num_of_new_rows
-            logger_info.info("Updated up to line number {num}".format(num=new_line_num))
-            cfg['sites'][site]['locations'][location]['dataloggers'][datalogger]['line_num'] = new_line_num
+        if num_of_new_lines > 0:
+            new_line_num = line_num + num_of_new_lines
+            logger_info.info("Updated up to line number %s", new_line_num)
+            datalogger_cfg = cfg['sites'][site]['locations'][location]['dataloggers'][datalogger]
+            datalogger_cfg['line_num'] = new_line_num
+            datalogger_cfg['byte_offset'] = new_byte_offset
+            datalogger_cfg['byte_offset_line_num'] = new_line_num
 
-    msg = "Done processing datalogger: {datalogger}"
-    logger_info.info(msg.format(datalogger=datalogger))
+    logger_info.info("Done processing datalogger: %s", datalogger)
 
     return cfg
 
@@ -478,51 +944,56 @@ def process_table_based(cfg, output_dir, site, location, datalogger, table, tabl
     -------
         Updated configuration file.
 
+    Raises
+    ------
+    UnsupportedExportFormat: If the table's export format can't be used.
+
     """
+    export_format = table_info.get('export_format', 'csv')
+    logger_debug.debug("Export format: %s", export_format)
+    check_export_format(export_format)
+
     header_row = table_info.get('header_row')
-    logger_debug.debug("Header row: {header_row}".format(header_row=header_row))
+    logger_debug.debug("Header row: %s", header_row)
 
     column_names = table_info.get('column_names')
-    logger_debug.debug("Column names: {column_names}".format(column_names=column_names))
+    logger_debug.debug("Column names: %s", column_names)
 
     export_columns = table_info.get('export_columns')
-    logger_debug.debug("Export columns: {export_columns}".format(export_columns=export_columns))
+    logger_debug.debug("Export columns: %s", export_columns)
 
     name = table_info.get('name', table)
-    logger_debug.debug("Name: {name}".format(name=name))
+    logger_debug.debug("Name: %s", name)
 
     convert_column_values = table_info.get('convert_data_column_values')
-    logger_debug.debug("Convert column values: {convert_column_values}".format(
-        convert_column_values=convert_column_values))
+    logger_debug.debug("Convert column values: %s", convert_column_values)
 
     file_path = table_info.get('file_path')
-    logger_debug.debug("File path: {file_path}".format(file_path=file_path))
+    logger_debug.debug("File path: %s", file_path)
 
     line_num = table_info.get('line_num', 0)
-    logger_debug.debug("Line num: {line_num}".format(line_num=line_num))
+    logger_debug.debug("Line num: %s", line_num)
 
     time_columns = table_info.get('time_columns')
-    logger_debug.debug("Time columns: {time_columns}".format(time_columns=time_columns))
+    logger_debug.debug("Time columns: %s", time_columns)
 
     time_format_args_library = table_info.get('time_format_args_library')
-    logger_debug.debug("Time format args library: {time_format_args_library}".format(
-        time_format_args_library=time_format_args_library))
+    logger_debug.debug("Time format args library: %s", time_format_args_library)
 
     time_parsed_column_name = table_info.get('time_parsed_column_name')
-    logger_debug.debug("Time parsed column name: {time_parsed_column_name}".format(
-        time_parsed_column_name=time_parsed_column_name))
+    logger_debug.debug("Time parsed column name: %s", time_parsed_column_name)
 
     time_zone = table_info.get('time_zone')
-    logger_debug.debug("Time zone: {time_zone}".format(time_zone=time_zone))
+    logger_debug.debug("Time zone: %s", time_zone)
 
     to_utc = table_info.get('to_utc', False)
-    logger_debug.debug("To UTC: {to_utc}".format(to_utc=to_utc))
+    logger_debug.debug("To UTC: %s", to_utc)
 
     include_time_zone = table_info.get('include_time_zone', False)
-    logger_debug.debug("Include time zone: {include_time_zone}".format(include_time_zone=include_time_zone))
+    logger_debug.debug("Include time zone: %s", include_time_zone)
 
     file_ext = os.path.splitext(os.path.abspath(file_path))[1]  # Get file extension
-    logger_debug.debug("File ext: {file_ext}".format(file_ext=file_ext))
+    logger_debug.debug("File ext: %s", file_ext)
 
     if column_names:
         data = cr.read_table_data(
@@ -555,9 +1026,9 @@ def process_table_based(cfg, output_dir, site, location, datalogger, table, tabl
     num_of_new_rows = 0
     num_of_new_rows += len(data)
 
-    logger_info.info("Found {num} new rows".format(num=num_of_new_rows))
+    logger_info.info("Found %s new rows", num_of_new_rows)
     if num_of_new_rows == 0:
-        logger_info.info("No work to be done for table: {table}".format(table=name))
+        logger_info.info("No work to be done for table: %s", name)
         return cfg
 
     if convert_column_values:
@@ -569,31 +1040,116 @@ def process_table_based(cfg, output_dir, site, location, datalogger, table, tabl
             to_utc=to_utc
         )
 
-    data_to_export = make_export_data_set(
+    data_to_export = export_columns_generator(
         data=data, columns_to_export=export_columns)
 
     file_name = name + file_ext
     outfile_path = os.path.join(
         os.path.abspath(output_dir), site, location, datalogger, file_name)
 
-    cr.export_to_csv(
+    export_data_set(
         data=data_to_export,
         outfile_path=outfile_path,
-        export_header=True,
+        export_format=export_format,
         include_time_zone=include_time_zone
     )
 
     if track:
         if num_of_new_rows > 0:
             new_line_num = line_num + num_of_new_rows
-            logger_info.info("Updated up to line number {num}".format(num=new_line_num))
+            logger_info.info("Updated up to line number %s", new_line_num)
             cfg['sites'][site]['locations'][location]['dataloggers'][datalogger]['tables'][table]['line_num'] = new_line_num
 
-    logger_info.info("Done processing table {table}".format(table=table))
+    logger_info.info("Done processing table %s", table)
+
+    return cfg
+
+
+def process_location(cfg, output_dir, site, location, location_info, datalogger=None,
+                     table=None, track=False):
+    """Processes a location's datalogger files.
+
+    Parameters
+    ----------
+    cfg : dict
+        Program's configuration file.
+    output_dir : str
+        Output directory.
+    site : str
+        Site id.
+    location : str
+        Location id.
+    location_info : dict
+        Location information including the location's dataloggers.
+    datalogger : str, optional
+        Specific datalogger to process. If not given, process all dataloggers.
+    table : str, optional
+        Specific table based file to process. Only used together with datalogger.
+    track: If true, update configuration file with the last read line number.
+
+    Returns
+    -------
+        Updated configuration file.
+
+    """
+    logger_debug.debug("Getting location configuration.")
+    dataloggers = location_info['dataloggers']
+    if logger_debug.isEnabledFor(logging.DEBUG):
+        logger_debug.debug("Configured dataloggers: %s.", ', '.join(map(str, dataloggers)))
+
+    if datalogger:
+        # Process specific datalogger
+        dataloggers_to_process = [(datalogger, dataloggers[datalogger])]
+    else:
+        # Process all dataloggers
+        dataloggers_to_process = dataloggers.items()
+
+    for datalogger_name, datalogger_info in dataloggers_to_process:
+        logger_info.info("Processing datalogger: %s", datalogger_name)
+        logger_debug.debug("Getting datalogger memory structure.")
+        memory_structure = datalogger_info['memory_structure']
+        if memory_structure == 'mixed array':
+            cfg = process_mixed_array(
+                cfg, output_dir, site, location, datalogger_name, datalogger_info, track)
+        elif memory_structure == 'table based':
+            tables = datalogger_info['tables']
+            if logger_debug.isEnabledFor(logging.DEBUG):
+                logger_debug.debug("Configured tables: %s.", ', '.join(map(str, tables)))
+            if datalogger and table:
+                # Process specific table based file
+                cfg = process_table_based(
+                    cfg, output_dir, site, location, datalogger_name, table, tables[table],
+                    track
+                )
+            else:
+                # Process all table based files
+                for table_name, table_info in tables.items():
+                    cfg = process_table_based(
+                        cfg, output_dir, site, location, datalogger_name, table_name,
+                        table_info, track
+                    )
+        else:
+            raise TypeError("Unsupported datalogger memory structure type!")
 
     return cfg
 
 
+def _process_location_job(output_dir, site, location, location_info, datalogger, table, track):
+    """Runs process_location in a worker process.
+
+    Returns
+    -------
+    dict
+        The location information, including updated line numbers if tracking is enabled.
+
+    """
+    cfg = {'sites': {site: {'locations': {location: location_info}}}}
+    process_location(
+        cfg, output_dir, site, location, location_info, datalogger, table, track)
+
+    return location_info
+
+
 def process_sites(cfg, args):
     """Unpacks data from the configuration file, calls the core function and updates line
         number information if tracking is enabled.
@@ -603,7 +1159,8 @@ def process_sites(cfg, args):
     cfg : dict
         Program's configuration file.
     args : Namespace
-        Arguments passed by the user. Includes site, location and tracking information.
+        Arguments passed by the user. Includes site, location, tracking and parallel jobs
+        information.
 
     """
     try:
@@ -611,17 +1168,16 @@ def process_sites(cfg, args):
     except KeyError:
         output_dir = os.path.expanduser("~")
         msg = "No output directory set! "
-        msg += "Files will be output to the user's default directory at {output_dir}"
-        msg = msg.format(output_dir=output_dir)
-        logger_info.info(msg)
+        msg += "Files will be output to the user's default directory at %s"
+        logger_info.info(msg, output_dir)
 
-    logger_debug.debug("Output directory: {dir}".format(dir=output_dir))
+    logger_debug.debug("Output directory: %s", output_dir)
     logger_debug.debug("Getting configured sites.")
 
     sites = cfg['sites']
 
-    configured_sites_msg = ', '.join("{site}".format(site=site) for site in sites)
-    logger_debug.debug("Configured sites: {sites}.".format(sites=configured_sites_msg))
+    if logger_debug.isEnabledFor(logging.DEBUG):
+        logger_debug.debug("Configured sites: %s.", ', '.join(map(str, sites)))
 
     if args.track:
         logger_info.info("Tracking is enabled.")
@@ -630,175 +1186,86 @@ def process_sites(cfg, args):
 
     if args.site:
         # Process specific site
-        logger_info.info("Processing site: {site}".format(site=args.site))
-        site_info = sites[args.site]
-        logger_debug.debug("Getting configured locations.")
+        sites_to_process = [(args.site, sites[args.site])]
+    else:
+        # Process all sites
+        sites_to_process = sites.items()
+
+    # Locations are independent of each other, collect them first so they can be
+    # processed in parallel.
+    location_jobs = []
+
+    for site, site_info in sites_to_process:
+        logger_debug.debug("Getting configured locations for site: %s", site)
         locations = site_info['locations']
-        configured_locations_msg = ', '.join("{location}".format(
-            location=location) for location in locations)
-        logger_debug.debug("Configured locations: {locations}.".format(
-            locations=configured_locations_msg))
+        if logger_debug.isEnabledFor(logging.DEBUG):
+            logger_debug.debug("Configured locations: %s.", ', '.join(map(str, locations)))
         if args.location:
             # Process specific location
-            logger_info.info("Processing location: {location}".format(location=args.location))
-            location_info = locations[args.location]
-            logger_debug.debug("Getting location configuration.")
-            dataloggers = location_info['dataloggers']
-            configured_dataloggers_msg = ', '.join("{datalogger}".format(
-                datalogger=datalogger) for datalogger in dataloggers)
-            logger_debug.debug("Configured dataloggers: {dataloggers}.".format(
-                dataloggers=configured_dataloggers_msg))
-            if args.datalogger:
-                # Process specific datalogger
-                logger_info.info(
-                    "Processing datalogger: {datalogger}".format(datalogger=args.datalogger))
-                datalogger_info = dataloggers[args.datalogger]
-                logger_debug.debug("Getting datalogger memory structure.")
-                memory_structure = datalogger_info['memory_structure']
-                if memory_structure == 'mixed array':
-                    cfg = process_mixed_array(
-                        cfg, output_dir, args.site, args.location, args.datalogger,
-                        datalogger_info, args.track)
-                elif memory_structure == 'table based':
-                    tables = datalogger_info['tables']
-                    configured_tables_msg = ', '.join("{table}".format(
-                        table=table) for table in tables)
-                    logger_debug.debug("Configured tables: {tables}.".format(
-                        tables=configured_tables_msg))
-                    if args.table:
-                        # Process specific table based file
-                        table_info = tables[args.table]
-                        cfg = process_table_based(
-                            cfg, output_dir, args.site, args.location, args.datalogger,
-                            args.table, table_info, args.track
-                        )
-                    else:
-                        # Process all table based files
-                        for table, table_info in tables.items():
-                            cfg = process_table_based(
-                                cfg, output_dir, args.site, args.location, args.datalogger,
-                                table, table_info, args.track
-                            )
-                else:
-                    raise TypeError("Unsupported datalogger memory structure type!")
-            else:
-                # Process all dataloggers
-                for datalogger, datalogger_info in dataloggers.items():
-                    logger_info.info(
-                        "Processing datalogger: {datalogger}".format(
-                            datalogger=datalogger))
-                    memory_structure = datalogger_info['memory_structure']
-                    if memory_structure == 'mixed array':
-                        cfg = process_mixed_array(
-                            cfg, output_dir, args.site, args.location, datalogger,
-                            datalogger_info, args.track)
-                    elif memory_structure == 'table based':
-                        tables = datalogger_info['tables']
-                        configured_tables_msg = ', '.join("{table}".format(
-                            table=table) for table in tables)
-                        logger_debug.debug("Configured tables: {tables}.".format(
-                            tables=configured_tables_msg))
-                        # Process all table based files
-                        for table, table_info in tables.items():
-                            cfg = process_table_based(
-                                cfg, output_dir, args.site, args.location, datalogger,
-                                table, table_info, args.track
-                            )
-                    else:
-                        raise TypeError("Unsupported datalogger memory structure type!")
-
+            location_jobs.append((
+                site, args.location, locations[args.location], args.datalogger, args.table))
         else:
             # Process all locations
             for location, location_info in locations.items():
-                logger_info.info(
-                    "Processing location: {location}".format(location=location))
-                logger_debug.debug("Getting location configuration.")
-                dataloggers = location_info['dataloggers']
-                configured_dataloggers_msg = ', '.join("{datalogger}".format(
-                    datalogger=datalogger) for datalogger in dataloggers)
-                logger_debug.debug("Configured dataloggers: {dataloggers}.".format(
-                    dataloggers=configured_dataloggers_msg))
-                # Process all dataloggers
-                for datalogger, datalogger_info in dataloggers.items():
-                    logger_info.info(
-                        "Processing datalogger: {datalogger}".format(
-                            datalogger=datalogger))
-                    memory_structure = datalogger_info['memory_structure']
-                    if memory_structure == 'mixed array':
-                        cfg = process_mixed_array(
-                            cfg, output_dir, args.site, location, datalogger,
-                            datalogger_info, args.track)
-                    elif memory_structure == 'table based':
-                        tables = datalogger_info['tables']
-                        configured_tables_msg = ', '.join("{table}".format(
-                            table=table) for table in tables)
-                        logger_debug.debug("Configured tables: {tables}.".format(
-                            tables=configured_tables_msg))
-                        # Process all table based files
-                        for table, table_info in tables.items():
-                            cfg = process_table_based(
-                                cfg, output_dir, args.site, location, datalogger, table,
-                                table_info, args.track
-                            )
-                    else:
-                        raise TypeError(
-                            "Unsupported datalogger memory structure type!")
-
-        logger_info.info("Done processing site: {site}".format(site=args.site))
+                location_jobs.append((site, location, location_info, None, None))
+
+    if args.jobs > 1 and len(location_jobs) > 1:
+        logger_info.info(
+            "Processing %s locations using %s jobs", len(location_jobs), args.jobs)
+        executor = concurrent.futures.ProcessPoolExecutor(
+            max_workers=args.jobs, initializer=configure_logging,
+            initargs=(LOGGING_CONFIG_PATH,))
+        with executor:
+            futures = [
+                executor.submit(
+                    _process_location_job, output_dir, site, location, location_info,
+                    datalogger, table, args.track)
+                for site, location, location_info, datalogger, table in location_jobs
+            ]
+            site_futures = itertools.groupby(
+                zip(location_jobs, futures), key=lambda job_future: job_future[0][0])
+            for site, jobs_futures in site_futures:
+                logger_info.info("Processing site: %s", site)
+                for (_, location, *_), future in jobs_futures:
+                    # Worker processes update their own copy of the location information.
+                    cfg['sites'][site]['locations'][location] = future.result()
+                    logger_info.info("Done processing location: %s", location)
+                logger_info.info("Done processing site: %s", site)
     else:
-        # Process all sites
-        for site, site_info in sites.items():
-            logger_info.info("Processing site: {site}".format(site=site))
-            locations = site_info['locations']
-            configured_locations_msg = ', '.join("{location}".format(
-                location=location) for location in locations)
-            logger_debug.debug("Configured locations: {locations}.".format(
-                locations=configured_locations_msg))
-            # Process all locations
-            for location, location_info in locations.items():
-                logger_info.info(
-                    "Processing location: {location}".format(location=location))
-                logger_debug.debug("Getting location configuration.")
-                dataloggers = location_info['dataloggers']
-                configured_dataloggers_msg = ', '.join("{datalogger}".format(
-                    datalogger=datalogger) for datalogger in dataloggers)
-                logger_debug.debug("Configured dataloggers: {dataloggers}.".format(
-                    dataloggers=configured_dataloggers_msg))
-                # Process all dataloggers
-                for datalogger, datalogger_info in dataloggers.items():
-                    logger_info.info(
-                        "Processing datalogger: {datalogger}".format(
-                            datalogger=datalogger))
-                    memory_structure = datalogger_info['memory_structure']
-                    if memory_structure == 'mixed array':
-                        cfg = process_mixed_array(
-                            cfg, output_dir, site, location, datalogger,
-                            datalogger_info, args.track)
-                    elif memory_structure == 'table based':
-                        tables = datalogger_info['tables']
-                        configured_tables_msg = ', '.join("{table}".format(
-                            table=table) for table in tables)
-                        logger_debug.debug("Configured tables: {tables}.".format(
-                            tables=configured_tables_msg))
-                        # Process all table based files
-                        for table, table_info in tables.items():
-                            cfg = process_table_based(
-                                cfg, output_dir, site, location, datalogger, table,
-                                table_info, args.track
-                            )
-                    else:
-                        raise TypeError(
-                            "Unsupported datalogger memory structure type!")
-
-            logger_info.info("Done processing site: {site}".format(site=args.site))
+        for site, site_jobs in itertools.groupby(location_jobs, key=lambda job: job[0]):
+            logger_info.info("Processing site: %s", site)
+            for _, location, location_info, datalogger, table in site_jobs:
+                logger_info.info("Processing location: %s", location)
+                cfg = process_location(
+                    cfg, output_dir, site, location, location_info, datalogger, table,
+                    args.track)
+            logger_info.info("Done processing site: %s", site)
 
     if args.track:
         logger_info.info("Updating config file.")
         utils.save_config(APP_CONFIG_PATH, cfg)
 
 
+def configure_logging(logging_config_path=LOGGING_CONFIG_PATH):
+    """Loads the logging configuration file.
+
+    Called by main, and by each worker process when locations are processed in parallel,
+    so importing the module doesn't require a logging configuration file.
+
+    Parameters
+    ----------
+    logging_config_path : str, optional
+        Logging configuration file's absolute path.
+
+    """
+    logging_conf = utils.load_config(logging_config_path)
+    logging.config.dictConfig(logging_conf)
+
+
 def main():
     """Parses and validates arguments from the command line. """
+    configure_logging()
+
     parser = argparse.ArgumentParser(
         prog='LoggerFilesFormatter',
         description='Program for formatting and exporting Campbell Scientific datalogger files.'
@@ -818,13 +1285,15 @@ def main():
         action='store_true',
         default=False
     )
+    parser.add_argument('-j', '--jobs', action='store', dest='jobs', type=int, default=1,
+                        help='Number of locations to process in parallel.')
 
     args = parser.parse_args()
 
     logger_debug.debug("Arguments passed by user")
-    args_msg = ', '.join("{arg}: {value}".format(
-        arg=arg, value=value) for (arg, value) in vars(args).items())
-    logger_debug.debug(args_msg)
+    if logger_debug.isEnabledFor(logging.DEBUG):
+        logger_debug.debug(', '.join("{arg}: {value}".format(
+            arg=arg, value=value) for (arg, value) in vars(args).items()))
 
     if args.location and not args.site:
         parser.error("--site is required.")
@@ -847,7 +1316,7 @@ def main():
     stop = time.time()
     elapsed_time = (stop - start)
 
-    logger_info.info("Finished job in {elapsed_time} seconds".format(elapsed_time=elapsed_time))
+    logger_info.info("Finished job in %s seconds", elapsed_time)
 
 if __name__ == '__main__':
     main()
@@ -3,8 +3,11 @@
 
 """Misc tools for common datalogger file operations. """
 
+import io
 import os
 
+from datetime import datetime
+
 import yaml
 
 
@@ -29,7 +32,7 @@ def load_config(cfg_file):
 
     """
     with open(cfg_file) as f:
-        cfg_dict = yaml.load(f)
+        cfg_dict = yaml.load(f, Loader=yaml.SafeLoader)
 
     return cfg_dict
 
@@ -64,6 +67,38 @@ def clean_data_output_dir(data_output_dir, *file_types):
             os.unlink(f)
 
 
+def export_to_csv_buffer(data, export_header=False, include_time_zone=False):
+    """Writes a data set to an in-memory CSV file, formatted like cr.export_to_csv.
+
+    Args
+    ----
+        data (DataSet): Data set to export.
+        export_header (bool): Write the column names as the first line.
+        include_time_zone (bool): Include time zone in string converted datetime values.
+
+    Returns
+    -------
+        Binary file-like object holding the CSV content, positioned at the start.
+
+    """
+    if include_time_zone:
+        time_format = "%Y-%m-%d %H:%M:%S%z"
+    else:
+        time_format = "%Y-%m-%d %H:%M:%S"
+
+    f_out = io.StringIO()
+    for row in data:
+        if export_header:
+            f_out.write(",".join(str(name) for name in row.keys()) + "\n")
+            export_header = False
+
+        f_out.write(",".join(
+            value.strftime(time_format) if isinstance(value, datetime) else str(value)
+            for value in row.values()) + "\n")
+
+    return io.BytesIO(f_out.getvalue().encode('utf-8'))
+
+
 def round_of_rating(number, rating):
     """
 
@@ -71,13 +71,15 @@ setup(
     # your project is installed. For an analysis of "install_requires" vs pip's
     # requirements files see:
     # https://packaging.python.org/en/latest/requirements.html
-    install_requires=['campbellsciparser', 'pyyaml'],
+    install_requires=['campbellsciparser', 'pytz', 'pyyaml'],
 
     # List additional groups of dependencies here (e.g. development
     # dependencies). You can install these using the following syntax,
     # for example:
     # $ pip install -e .[dev,test]
     extras_require={
+        'fast': ['pandas'],
+        'parquet': ['pyarrow'],
         #'dev': ['check-manifest'],
         #'test': ['coverage'],
     },
@@ -0,0 +1,525 @@
+import argparse
+import os
+
+from datetime import datetime
+
+import pytest
+import pytz
+
+from campbellsciparser import cr
+
+from services import loggerfilesformatter
+from services import utils
+
+
+def test_export_to_parquet(tmpdir):
+    pq = pytest.importorskip('pyarrow.parquet')
+
+    data = cr.DataSet([
+        cr.Row([('Label_1', '1'), ('Label_2', '1.5'), ('Label_3', 'a'),
+                ('Label_4', datetime(2016, 5, 2, 12, 34, 15, tzinfo=pytz.UTC))]),
+        cr.Row([('Label_1', '2'), ('Label_2', '-6999'), ('Label_3', '3'),
+                ('Label_4', datetime(2016, 5, 2, 13, 34, 15, tzinfo=pytz.UTC))])
+    ])
+    outdir_path = str(tmpdir.join('array'))
+
+    outfile_path = loggerfilesformatter.export_to_parquet(data, outdir_path)
+    assert os.path.dirname(outfile_path) == outdir_path
+    assert outfile_path.endswith('.parquet')
+
+    table = pq.read_table(outfile_path)
+    assert table.column_names == ['Label_1', 'Label_2', 'Label_3', 'Label_4']
+    assert str(table.schema.field('Label_1').type) == 'double'
+    assert str(table.schema.field('Label_2').type) == 'double'
+    assert str(table.schema.field('Label_3').type) == 'string'
+    assert table.to_pylist() == [
+        {'Label_1': 1.0, 'Label_2': 1.5, 'Label_3': 'a',
+         'Label_4': datetime(2016, 5, 2, 12, 34, 15, tzinfo=pytz.UTC)},
+        {'Label_1': 2.0, 'Label_2': -6999.0, 'Label_3': '3',
+         'Label_4': datetime(2016, 5, 2, 13, 34, 15, tzinfo=pytz.UTC)}
+    ]
+
+
+def test_export_to_parquet_parts_share_schema(tmpdir):
+    pq = pytest.importorskip('pyarrow.parquet')
+
+    outdir_path = str(tmpdir.join('array'))
+    loggerfilesformatter.export_to_parquet(cr.DataSet([
+        cr.Row([('Label_1', '1'), ('Label_2', 'a'),
+                ('Label_3', datetime(2016, 5, 2, 12, 34, 15, tzinfo=pytz.UTC))])
+    ]), outdir_path)
+    loggerfilesformatter.export_to_parquet(cr.DataSet([
+        cr.Row([('Label_1', 'NAN'), ('Label_2', '3'),
+                ('Label_3', datetime(2016, 5, 2, 13, 34, 15, tzinfo=pytz.UTC))]),
+        cr.Row([('Label_1', 'x'), ('Label_2', '4'),
+                ('Label_3', datetime(2016, 5, 2, 14, 34, 15, tzinfo=pytz.UTC))])
+    ]), outdir_path)
+
+    assert len(os.listdir(outdir_path)) == 2
+
+    table = pq.read_table(outdir_path)
+    assert str(table.schema.field('Label_1').type) == 'double'
+    assert str(table.schema.field('Label_2').type) == 'string'
+
+    rows = sorted(table.to_pylist(), key=lambda row: row['Label_3'])
+    assert rows[0] == {'Label_1': 1.0, 'Label_2': 'a',
+                       'Label_3': datetime(2016, 5, 2, 12, 34, 15, tzinfo=pytz.UTC)}
+    assert rows[1]['Label_1'] != rows[1]['Label_1']  # NaN
+    assert rows[1]['Label_2'] == '3'
+    assert rows[2]['Label_1'] is None
+    assert rows[2]['Label_2'] == '4'
+
+
+def test_export_to_parquet_empty(tmpdir):
+    pytest.importorskip('pyarrow')
+
+    outdir_path = str(tmpdir.join('array'))
+    assert loggerfilesformatter.export_to_parquet(cr.DataSet(), outdir_path) is None
+    assert not os.path.exists(outdir_path)
+
+
+def test_check_export_format_invalid():
+    with pytest.raises(loggerfilesformatter.UnsupportedExportFormat):
+        loggerfilesformatter.check_export_format('parqet')
+
+
+MIXED_ARRAY_LINES = [
+    '101,2016,1,1200,.5,-.25\n',
+    '102,2016,1,1200,44.2\n',
+    '101,2016,1,1300,1.5,-1.25\n',
+    '103,2016,1,1300,7\n',
+    '102,2016,1,1300,45.2\n'
+]
+
+
+def write_mixed_array_file(tmpdir, lines):
+    infile = tmpdir.join('mixed_array.dat')
+    infile.write(''.join(lines))
+
+    return str(infile)
+
+
+def test_read_array_ids_data_first_line_num(tmpdir):
+    infile_path = write_mixed_array_file(tmpdir, MIXED_ARRAY_LINES)
+
+    data, lines_read, byte_offset = loggerfilesformatter.read_array_ids_data(
+        infile_path=infile_path, first_line_num=2, array_id_names={'101': None, '102': None})
+
+    assert lines_read == 3
+    assert byte_offset == os.path.getsize(infile_path)
+    assert [row[3] for row in data['101']] == ['1300']
+    assert [row[3] for row in data['102']] == ['1300']
+
+
+def test_read_array_ids_data_byte_offset(tmpdir):
+    infile_path = write_mixed_array_file(tmpdir, MIXED_ARRAY_LINES)
+    array_id_names = {'101': None, '102': None}
+
+    _, lines_read, byte_offset = loggerfilesformatter.read_array_ids_data(
+        infile_path=infile_path, first_line_num=2, array_id_names=array_id_names)
+
+    with open(infile_path, 'a') as f:
+        f.write('101,2016,1,1400,2.5,-2.25\n')
+
+    data, lines_read, new_byte_offset = loggerfilesformatter.read_array_ids_data(
+        infile_path=infile_path, byte_offset=byte_offset, array_id_names=array_id_names)
+
+    assert lines_read == 1
+    assert new_byte_offset == os.path.getsize(infile_path)
+    assert list(data) == ['101']
+    assert [row[3] for row in data['101']] == ['1400']
+
+
+def test_read_array_ids_data_unterminated_line(tmpdir):
+    infile_path = write_mixed_array_file(tmpdir, MIXED_ARRAY_LINES[:2] + ['101,2016,1,13'])
+    array_id_names = {'101': None, '102': None}
+
+    data, lines_read, byte_offset = loggerfilesformatter.read_array_ids_data(
+        infile_path=infile_path, array_id_names=array_id_names)
+
+    assert lines_read == 2
+    assert byte_offset == len(''.join(MIXED_ARRAY_LINES[:2]))
+    assert len(data['101']) == 1
+
+    # Skipping by line number stops at the unterminated line as well.
+    _, _, skipped_byte_offset = loggerfilesformatter.read_array_ids_data(
+        infile_path=infile_path, first_line_num=3, array_id_names=array_id_names)
+
+    assert skipped_byte_offset == byte_offset
+
+    with open(infile_path, 'a') as f:
+        f.write('00,1.5,-1.25\n')
+
+    data, lines_read, byte_offset = loggerfilesformatter.read_array_ids_data(
+        infile_path=infile_path, byte_offset=byte_offset, array_id_names=array_id_names)
+
+    assert lines_read == 1
+    assert byte_offset == os.path.getsize(infile_path)
+    assert list(data['101'][0].values()) == ['101', '2016', '1', '1300', '1.5', '-1.25']
+
+
+def test_read_array_ids_data_unconfigured_array_ids(tmpdir):
+    infile_path = write_mixed_array_file(tmpdir, MIXED_ARRAY_LINES)
+
+    data, lines_read, byte_offset = loggerfilesformatter.read_array_ids_data(
+        infile_path=infile_path, array_id_names={'103': None})
+
+    assert lines_read == len(MIXED_ARRAY_LINES)
+    assert byte_offset == os.path.getsize(infile_path)
+    assert list(data) == ['103']
+
+
+def test_read_array_ids_data_matches_cr(tmpdir):
+    infile_path = write_mixed_array_file(tmpdir, MIXED_ARRAY_LINES)
+    array_id_names = {'101': 'array_101', '102': None}
+
+    data, _, _ = loggerfilesformatter.read_array_ids_data(
+        infile_path=infile_path, fix_floats=True, array_id_names=array_id_names)
+
+    expected_data = cr.read_array_ids_data(
+        infile_path=infile_path, fix_floats=True, array_id_names=array_id_names)
+
+    assert sorted(data) == sorted(expected_data) == ['102', 'array_101']
+    for array_name, array_data in data.items():
+        assert list(array_data) == list(expected_data[array_name])
+    assert list(data['array_101'][0].values()) == ['101', '2016', '1', '1200', '0.5', '-0.25']
+
+
+TIME_FORMAT_ARGS_LIBRARY = ['%Y', '%j', '%H%M']
+
+
+def make_time_data(time_values):
+    return cr.DataSet(
+        [cr.Row(enumerate(['101'] + list(values) + ['44.2'])) for values in time_values])
+
+
+@pytest.mark.parametrize('to_utc', [False, True])
+def test_parse_time_values_vectorized_matches_cr(to_utc):
+    pytest.importorskip('pandas')
+
+    # Around the Europe/Stockholm DST changes (day 87 and 304 of 2016), including a
+    # non-existent and an ambiguous local time.
+    time_values = [
+        (year, day, hour_minute)
+        for year in ('2015', '2016')
+        for day in ('1', '86', '87', '88', '303', '304', '305')
+        for hour_minute in ('0', '5', '30', '130', '200', '230', '300', '1230', '2359')
+    ]
+
+    parsed_times = loggerfilesformatter._parse_time_values_vectorized(
+        data=make_time_data(time_values),
+        value_time_columns=[1, 2, 3],
+        time_zone='Europe/Stockholm',
+        time_format_args_library=TIME_FORMAT_ARGS_LIBRARY,
+        to_utc=to_utc)
+
+    expected_data = cr.parse_time(
+        data=make_time_data(time_values),
+        time_zone='Europe/Stockholm',
+        time_format_args_library=TIME_FORMAT_ARGS_LIBRARY,
+        time_columns=[1, 2, 3],
+        time_parsed_column='Timestamp',
+        to_utc=to_utc)
+    expected_times = loggerfilesformatter.get_column_values(expected_data, 'Timestamp')
+
+    assert parsed_times == expected_times
+    assert [dt.utcoffset() for dt in parsed_times] == [
+        dt.utcoffset() for dt in expected_times]
+
+
+def test_parse_time_values_vectorized_hour_minute_padding():
+    pytest.importorskip('pandas')
+
+    parsed_times = loggerfilesformatter._parse_time_values_vectorized(
+        data=make_time_data([('2016', '1', '5'), ('2016', '1', '45'),
+                             ('2016', '1', '130'), ('2016', '1', '2359')]),
+        value_time_columns=[1, 2, 3],
+        time_zone='UTC',
+        time_format_args_library=TIME_FORMAT_ARGS_LIBRARY,
+        to_utc=False)
+
+    assert parsed_times == [
+        datetime(2016, 1, 1, 0, 5, tzinfo=pytz.UTC),
+        datetime(2016, 1, 1, 0, 45, tzinfo=pytz.UTC),
+        datetime(2016, 1, 1, 1, 30, tzinfo=pytz.UTC),
+        datetime(2016, 1, 1, 23, 59, tzinfo=pytz.UTC)
+    ]
+
+
+@pytest.mark.parametrize('time_values, time_zone, time_format_args_library', [
+    ([('2016', '1', '1200')], 'UTC', ['%Y', '%j', '%z']),
+    ([('2016', '1', '1200')], 'Not/A_Time_Zone', TIME_FORMAT_ARGS_LIBRARY),
+    ([('2016', '1', '1200'), ('2016', '1')], 'UTC', TIME_FORMAT_ARGS_LIBRARY),
+    ([('2016', '1', '12000')], 'UTC', TIME_FORMAT_ARGS_LIBRARY),
+    ([('2016', 'a', '1200')], 'UTC', TIME_FORMAT_ARGS_LIBRARY),
+    ([('2016-05-02 12:00:00',), ('',)], 'UTC', ['%Y-%m-%d %H:%M:%S']),
+    ([('2016-05-02 12:00:00',), ('NAN',)], 'UTC', ['%Y-%m-%d %H:%M:%S']),
+    ([('2016-05-02 12:00:00',), ('now',)], 'UTC', ['%Y-%m-%d %H:%M:%S'])
+])
+def test_parse_time_values_vectorized_fallback(time_values, time_zone,
+                                               time_format_args_library):
+    pytest.importorskip('pandas')
+
+    data = cr.DataSet([cr.Row(enumerate(['101'] + list(values))) for values in time_values])
+
+    assert loggerfilesformatter._parse_time_values_vectorized(
+        data=data,
+        value_time_columns=[1, 2, 3],
+        time_zone=time_zone,
+        time_format_args_library=time_format_args_library,
+        to_utc=False) is None
+
+
+@pytest.mark.parametrize('disable_pandas', [False, True])
+def test_parse_data_time_columns_matches_cr(monkeypatch, disable_pandas):
+    if disable_pandas:
+        monkeypatch.setattr(loggerfilesformatter, 'pd', None)
+    else:
+        pytest.importorskip('pandas')
+
+    time_values = [('2016', '87', '130'), ('2016', '87', '230'), ('2016', '304', '245')]
+
+    def make_named_time_data():
+        return cr.update_column_names(
+            data=make_time_data(time_values),
+            column_names=['Id', 'Year', 'Day', 'Hour_Minute', 'Value'])
+
+    time_parsing_info = dict(
+        time_zone='Europe/Stockholm',
+        time_format_args_library=TIME_FORMAT_ARGS_LIBRARY,
+        time_columns=('Year', 'Day', 'Hour_Minute'),
+        time_parsed_column='Timestamp',
+        to_utc=True)
+
+    data = loggerfilesformatter.parse_data_time_columns(
+        data=make_named_time_data(), **time_parsing_info)
+    expected_data = cr.parse_time(data=make_named_time_data(), **time_parsing_info)
+
+    assert list(data) == list(expected_data)
+    assert list(data[0]) == ['Id', 'Timestamp', 'Value']
+
+
+def make_mixed_array_cfg(infile_path):
+    datalogger_info = {
+        'file_path': infile_path,
+        'line_num': 0,
+        'time_zone': 'UTC',
+        'time_format_args_library': TIME_FORMAT_ARGS_LIBRARY,
+        'array_ids': {
+            '101': {
+                'name': 'array_101',
+                'column_names': ['Id', 'Year', 'Day', 'Hour_Minute', 'Value_1', 'Value_2'],
+                'export_columns': ['Timestamp', 'Value_1'],
+                'time_columns': ['Year', 'Day', 'Hour_Minute']
+            }
+        }
+    }
+    cfg = {'sites': {'site': {'locations': {'location': {'dataloggers': {
+        'datalogger': datalogger_info}}}}}}
+
+    return cfg, datalogger_info
+
+
+def process_mixed_array_file(cfg, datalogger_info, output_dir):
+    loggerfilesformatter.process_mixed_array(
+        cfg, output_dir, 'site', 'location', 'datalogger', datalogger_info, track=True)
+
+    with open(os.path.join(output_dir, 'site', 'location', 'datalogger',
+                           'array_101.dat')) as f:
+        return f.read().splitlines()[1:]
+
+
+def test_process_mixed_array_resumes_from_byte_offset(tmpdir):
+    infile_path = write_mixed_array_file(tmpdir, MIXED_ARRAY_LINES)
+    output_dir = str(tmpdir.join('output'))
+    cfg, datalogger_info = make_mixed_array_cfg(infile_path)
+
+    exported_rows = process_mixed_array_file(cfg, datalogger_info, output_dir)
+    assert exported_rows == ['2016-01-01 12:00:00,0.5', '2016-01-01 13:00:00,1.5']
+    assert datalogger_info['line_num'] == len(MIXED_ARRAY_LINES)
+    assert datalogger_info['byte_offset'] == os.path.getsize(infile_path)
+    assert datalogger_info['byte_offset_line_num'] == len(MIXED_ARRAY_LINES)
+
+    with open(infile_path, 'a') as f:
+        f.write('101,2016,1,1400,2.5,-2.25\n')
+
+    exported_rows = process_mixed_array_file(cfg, datalogger_info, output_dir)
+    assert exported_rows[2:] == ['2016-01-01 14:00:00,2.5']
+    assert datalogger_info['line_num'] == len(MIXED_ARRAY_LINES) + 1
+    assert datalogger_info['byte_offset'] == os.path.getsize(infile_path)
+
+
+def test_process_mixed_array_lowered_line_num(tmpdir):
+    infile_path = write_mixed_array_file(tmpdir, MIXED_ARRAY_LINES)
+    output_dir = str(tmpdir.join('output'))
+    cfg, datalogger_info = make_mixed_array_cfg(infile_path)
+
+    process_mixed_array_file(cfg, datalogger_info, output_dir)
+
+    # Lowering the line number exports the rows again, despite the stored byte offset.
+    datalogger_info['line_num'] = 2
+
+    exported_rows = process_mixed_array_file(cfg, datalogger_info, output_dir)
+    assert exported_rows[2:] == ['2016-01-01 13:00:00,1.5']
+    assert datalogger_info['line_num'] == len(MIXED_ARRAY_LINES)
+    assert datalogger_info['byte_offset'] == os.path.getsize(infile_path)
+    assert datalogger_info['byte_offset_line_num'] == len(MIXED_ARRAY_LINES)
+
+
+@pytest.mark.parametrize('disable_pandas', [False, True])
+def test_convert_data_column_values(monkeypatch, disable_pandas):
+    if disable_pandas:
+        monkeypatch.setattr(loggerfilesformatter, 'pd', None)
+    else:
+        pytest.importorskip('pandas')
+
+    data = cr.update_column_names(
+        data=cr.DataSet([
+            cr.Row(enumerate(['101', '2016', '1', '1230', '44.2', '', ''])),
+            cr.Row(enumerate(['101', '2016', '183', '5', '45.2', '', '']))
+        ]),
+        column_names=['Id', 'Year', 'Day', 'Hour_Minute', 'Value', 'Time', 'Date'])
+
+    data_converted = loggerfilesformatter.convert_data_column_values(
+        data=data,
+        values_to_convert={
+            'Time': {'value_type': 'time',
+                     'value_time_columns': ['Year', 'Day', 'Hour_Minute']},
+            'Date': {'value_type': 'time', 'value_time_columns': ['Year', 'Day']}
+        },
+        time_zone='Europe/Stockholm',
+        time_format_args_library=TIME_FORMAT_ARGS_LIBRARY,
+        to_utc=True)
+
+    assert data_converted is data
+    assert [list(row.items()) for row in data_converted] == [
+        [('Id', '101'), ('Year', '2016'), ('Day', '1'), ('Hour_Minute', '1230'),
+         ('Value', '44.2'), ('Time', datetime(2016, 1, 1, 11, 30, tzinfo=pytz.UTC)),
+         ('Date', datetime(2015, 12, 31, 23, 0, tzinfo=pytz.UTC))],
+        [('Id', '101'), ('Year', '2016'), ('Day', '183'), ('Hour_Minute', '5'),
+         ('Value', '45.2'), ('Time', datetime(2016, 6, 30, 22, 5, tzinfo=pytz.UTC)),
+         ('Date', datetime(2016, 6, 30, 22, 0, tzinfo=pytz.UTC))]
+    ]
+
+
+def test_convert_data_column_values_unsupported_type():
+    data = cr.DataSet([cr.Row([('Value', '44.2')])])
+
+    with pytest.raises(loggerfilesformatter.UnsupportedValueConversionType):
+        loggerfilesformatter.convert_data_column_values(
+            data=data,
+            values_to_convert={'Value': {'value_type': 'float'}},
+            time_zone='UTC',
+            time_format_args_library=TIME_FORMAT_ARGS_LIBRARY,
+            to_utc=False)
+
+
+def make_sites_cfg(output_dir):
+    def mixed_array():
+        return {'memory_structure': 'mixed array'}
+
+    def table_based(*tables):
+        return {'memory_structure': 'table based', 'tables': {table: {} for table in tables}}
+
+    return {
+        'settings': {'data_output_dir': output_dir},
+        'sites': {
+            'site_1': {'locations': {
+                'location_1': {'dataloggers': {
+                    'datalogger_1': mixed_array(),
+                    'datalogger_2': table_based('table_1', 'table_2')
+                }},
+                'location_2': {'dataloggers': {'datalogger_3': mixed_array()}}
+            }},
+            'site_2': {'locations': {
+                'location_3': {'dataloggers': {'datalogger_4': mixed_array()}}
+            }}
+        }
+    }
+
+
+ALL_CALLS = [
+    ('mixed array', 'site_1', 'location_1', 'datalogger_1'),
+    ('table based', 'site_1', 'location_1', 'datalogger_2', 'table_1'),
+    ('table based', 'site_1', 'location_1', 'datalogger_2', 'table_2'),
+    ('mixed array', 'site_1', 'location_2', 'datalogger_3'),
+    ('mixed array', 'site_2', 'location_3', 'datalogger_4')
+]
+
+
+@pytest.mark.parametrize('site, location, datalogger, table, expected_calls', [
+    (None, None, None, None, ALL_CALLS),
+    ('site_1', None, None, None, ALL_CALLS[:4]),
+    ('site_1', None, 'datalogger_1', None, ALL_CALLS[:4]),
+    ('site_1', 'location_1', None, None, ALL_CALLS[:3]),
+    ('site_1', 'location_1', 'datalogger_1', None, ALL_CALLS[:1]),
+    ('site_1', 'location_1', 'datalogger_2', None, ALL_CALLS[1:3]),
+    ('site_1', 'location_1', 'datalogger_2', 'table_2', ALL_CALLS[2:3]),
+    ('site_2', 'location_3', None, None, ALL_CALLS[4:])
+])
+def test_process_sites_dispatch(monkeypatch, tmpdir, site, location, datalogger, table,
+                                expected_calls):
+    calls = []
+
+    def process_mixed_array(cfg, output_dir, site, location, datalogger, datalogger_info,
+                            track=False):
+        assert output_dir == str(tmpdir)
+        assert track
+        calls.append(('mixed array', site, location, datalogger))
+        return cfg
+
+    def process_table_based(cfg, output_dir, site, location, datalogger, table, table_info,
+                            track=False):
+        assert output_dir == str(tmpdir)
+        assert track
+        calls.append(('table based', site, location, datalogger, table))
+        return cfg
+
+    monkeypatch.setattr(loggerfilesformatter, 'process_mixed_array', process_mixed_array)
+    monkeypatch.setattr(loggerfilesformatter, 'process_table_based', process_table_based)
+    monkeypatch.setattr(
+        loggerfilesformatter, 'APP_CONFIG_PATH', str(tmpdir.join('config.yaml')))
+
+    args = argparse.Namespace(
+        site=site, location=location, datalogger=datalogger, table=table, track=True, jobs=1)
+
+    loggerfilesformatter.process_sites(make_sites_cfg(str(tmpdir)), args)
+
+    assert calls == expected_calls
+
+
+def test_process_sites_jobs_track(monkeypatch, tmpdir):
+    logging_config_path = tmpdir.join('logging.yaml')
+    logging_config_path.write('version: 1\n')
+    monkeypatch.setattr(loggerfilesformatter, 'LOGGING_CONFIG_PATH', str(logging_config_path))
+    monkeypatch.setattr(
+        loggerfilesformatter, 'APP_CONFIG_PATH', str(tmpdir.join('config.yaml')))
+
+    output_dir = str(tmpdir.join('output'))
+    cfg = {'settings': {'data_output_dir': output_dir}, 'sites': {}}
+
+    for location, lines in (('location_1', MIXED_ARRAY_LINES),
+                            ('location_2', MIXED_ARRAY_LINES[:3])):
+        location_dir = tmpdir.mkdir(location)
+        _, datalogger_info = make_mixed_array_cfg(write_mixed_array_file(location_dir, lines))
+        datalogger_info['memory_structure'] = 'mixed array'
+        cfg['sites'].setdefault('site', {'locations': {}})['locations'][location] = {
+            'dataloggers': {'datalogger': datalogger_info}}
+
+    args = argparse.Namespace(
+        site=None, location=None, datalogger=None, table=None, track=True, jobs=2)
+
+    loggerfilesformatter.process_sites(cfg, args)
+
+    for location, lines in (('location_1', MIXED_ARRAY_LINES),
+                            ('location_2', MIXED_ARRAY_LINES[:3])):
+        datalogger_info = cfg['sites']['site']['locations'][location]['dataloggers'][
+            'datalogger']
+        assert datalogger_info['line_num'] == len(lines)
+        assert datalogger_info['byte_offset'] == len(''.join(lines))
+        assert datalogger_info['byte_offset_line_num'] == len(lines)
+        assert os.path.exists(
+            os.path.join(output_dir, 'site', location, 'datalogger', 'array_101.dat'))
+
+    saved_cfg = utils.load_config(str(tmpdir.join('config.yaml')))
+    assert saved_cfg['sites'] == cfg['sites']
@@ -1,6 +1,10 @@
 import os
 
+from collections import OrderedDict
+from datetime import datetime
+
 import pytest
+import pytz
 
 from services import utils
 
@@ -97,3 +101,25 @@ def test_round_of_rating_valid_ratings():
 def test_round_of_rating_invalid_rating():
     with pytest.raises(utils.InvalidRatingValueError):
         utils.round_of_rating(number=1.55, rating=0.33)
+
+
+def test_export_to_csv_buffer():
+    data = [
+        OrderedDict([('Label_1', 'some_value'),
+                     ('Label_2', datetime(2016, 5, 2, 12, 34, 15, tzinfo=pytz.UTC))]),
+        OrderedDict([('Label_1', 1.5),
+                     ('Label_2', datetime(2016, 5, 2, 13, 34, 15, tzinfo=pytz.UTC))])
+    ]
+
+    f = utils.export_to_csv_buffer(data, export_header=True)
+    assert f.read() == (
+        b"Label_1,Label_2\n"
+        b"some_value,2016-05-02 12:34:15\n"
+        b"1.5,2016-05-02 13:34:15\n"
+    )
+
+    f = utils.export_to_csv_buffer(data, include_time_zone=True)
+    assert f.read() == (
+        b"some_value,2016-05-02 12:34:15+0000\n"
+        b"1.5,2016-05-02 13:34:15+0000\n"
+    )